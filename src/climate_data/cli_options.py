@@ -146,6 +146,20 @@ def with_target_variable(
     )
 
 
+def with_source_variable(
+    variable_names: Collection[str],
+    *,
+    allow_all: bool = False,
+) -> ClickOption[_P, _T]:
+    return with_choice(
+        "source-variable",
+        allow_all=allow_all,
+        choices=variable_names,
+        help="Source variable to generate targets from.",
+        convert=allow_all,
+    )
+
+
 def with_draw(
     *,
     allow_all: bool = False,
@@ -200,6 +214,7 @@ __all__ = [
     "with_progress_bar",
     "with_queue",
     "with_scenario",
+    "with_source_variable",
     "with_target_variable",
     "with_verbose",
     "with_year",
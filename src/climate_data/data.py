@@ -13,6 +13,7 @@ which is generally loaded and cached on disk.
 """
 
 from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -282,9 +283,13 @@ class ClimateData:
         scenario: str,
         variable: str,
         year: int | str,
+        chunks: dict[str, int] | None = None,
+        mask_and_scale: bool = True,
     ) -> xr.Dataset:
         results_path = self.daily_results_path(scenario, variable, year)
-        return xr.open_dataset(results_path)
+        return xr.open_dataset(
+            results_path, chunks=chunks, mask_and_scale=mask_and_scale
+        )
 
     @property
     def annual_results(self) -> Path:
@@ -320,6 +325,17 @@ class ClimateData:
     ) -> None:
         path = self.raw_annual_results_path(scenario, variable, year, gcm_member)
         mkdir(path.parent, exist_ok=True, parents=True)
+        # Annual results are small and always read whole, so store each year as a
+        # single chunk and spend a little more time on compression.
+        chunksizes = tuple(
+            1 if dim == "year" else size
+            for dim, size in results_ds["value"].sizes.items()
+        )
+        encoding_kwargs = {
+            "chunksizes": chunksizes,
+            "complevel": 4,
+            **encoding_kwargs,
+        }
         save_xarray(results_ds, path, encoding_kwargs)
 
     @property
@@ -361,11 +377,57 @@ class ClimateData:
         variable: str,
         gcm_member: str,
     ) -> None:
-        source_path = self.compiled_annual_results_path(scenario, variable, gcm_member)
         dest_path = self.annual_results_path(scenario, variable, draw)
         mkdir(dest_path.parent, exist_ok=True, parents=True)
-        if dest_path.exists():
-            dest_path.unlink()
+        self._link_annual_draw(draw, scenario, variable, gcm_member)
+
+    def link_annual_draws(
+        self,
+        gcm_members: Collection[str],
+        scenario: str,
+        variable: str,
+        max_workers: int = 16,
+    ) -> None:
+        """Link each draw to the compiled results of its GCM member.
+
+        Parameters
+        ----------
+        gcm_members
+            The GCM member for each draw, in draw order.
+        scenario
+            The scenario to link draws for.
+        variable
+            The variable to link draws for.
+        max_workers
+            The number of links to create concurrently.
+        """
+        mkdir(
+            self.annual_results_path(scenario, variable, 0).parent,
+            exist_ok=True,
+            parents=True,
+        )
+        # Each link is a few metadata round trips on the shared filesystem, so
+        # overlap them. The directory is made up front as mkdir swaps the umask.
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self._link_annual_draw, draw, scenario, variable, gcm_member
+                )
+                for draw, gcm_member in enumerate(gcm_members)
+            ]
+            for future in futures:
+                future.result()
+
+    def _link_annual_draw(
+        self,
+        draw: int | str,
+        scenario: str,
+        variable: str,
+        gcm_member: str,
+    ) -> None:
+        source_path = self.compiled_annual_results_path(scenario, variable, gcm_member)
+        dest_path = self.annual_results_path(scenario, variable, draw)
+        dest_path.unlink(missing_ok=True)
         dest_path.symlink_to(source_path)
 
 
@@ -79,17 +79,18 @@ def draws_main(
 
     num_draws = 1000
     rs = np.random.RandomState(42)
-    for draw in tqdm.trange(num_draws):
+    draw_gcm_members = []
+    for _ in range(num_draws):
         gcm = rs.choice(list(source_member_map))
         member = rs.choice(source_member_map[gcm])
-        gcm_member = f"{gcm}_{member}"
-        for scenario in cdc.CMIP6_EXPERIMENTS:
-            cdata.link_annual_draw(
-                draw=draw,
-                variable=target_variable,
-                scenario=scenario,
-                gcm_member=gcm_member,
-            )
+        draw_gcm_members.append(f"{gcm}_{member}")
+
+    for scenario in tqdm.tqdm(cdc.CMIP6_EXPERIMENTS):
+        cdata.link_annual_draws(
+            draw_gcm_members,
+            variable=target_variable,
+            scenario=scenario,
+        )
 
 
 @click.command()  # type: ignore[arg-type]
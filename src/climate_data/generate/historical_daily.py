@@ -1,8 +1,8 @@
-import itertools
 from pathlib import Path
 
 import click
 import dask
+import numpy as np
 import pandas as pd
 import xarray as xr
 from rra_tools import jobmon
@@ -132,6 +132,8 @@ def validate_output(ds: xr.Dataset, year: str) -> None:  # noqa: C901
         if extra:
             error_msg_parts.append(f"Extra {name}: {extra}")
 
+    if not ds.indexes["date"].is_monotonic_increasing:
+        error_msg_parts.append("Dates are not sorted")
     if ds.date.min() != pd.Timestamp(f"{year}-01-01"):
         error_msg_parts.append(f"Unexpected start date: {ds.date.min()}")
     if ds.date.max() != pd.Timestamp(f"{year}-12-31"):
@@ -140,9 +142,9 @@ def validate_output(ds: xr.Dataset, year: str) -> None:  # noqa: C901
     if ds.dims["date"] != num_days:
         error_msg_parts.append(f"Unexpected number of days: {ds.dims['date']}")
 
-    if not (ds.latitude == cdc.TARGET_LATITUDE[::-1]).all().item():
+    if not np.array_equal(ds.latitude.to_numpy(), cdc.TARGET_LATITUDE[::-1].to_numpy()):
         error_msg_parts.append("Unexpected latitude")
-    if not (ds.longitude == cdc.TARGET_LONGITUDE).all().item():
+    if not np.array_equal(ds.longitude.to_numpy(), cdc.TARGET_LONGITUDE.to_numpy()):
         error_msg_parts.append("Unexpected longitude")
 
     if str(ds["value"].dtype) not in ["float32", "float64"]:
@@ -180,9 +182,11 @@ def generate_historical_daily_main(
             for sv in transform.source_variables
         ]
         print("collapsing")
+        # Persist rather than compute so the regridding and combining below run
+        # on the chunked arrays. The month is materialized once at the end.
         ds_single_level = transform(
             *single_level, key=cdc.ERA5_DATASETS.reanalysis_era5_single_levels
-        ).compute()
+        ).persist()
         # collapsing often screws the date dtype, so fix it
         ds_single_level = ds_single_level.assign(
             date=pd.to_datetime(ds_single_level.date)
@@ -195,7 +199,7 @@ def generate_historical_daily_main(
 
         if target_variable == cdc.ERA5_VARIABLES.sea_surface_temperature:
             # sea surface temperature is only available in the single-level dataset
-            datasets.append(ds_single_level)
+            datasets.append(ds_single_level.compute())
         else:
             print(f"loading land for {month_str}")
             land = [
@@ -208,17 +212,18 @@ def generate_historical_daily_main(
             with dask.config.set(**{"array.slicing.split_large_chunks": False}):  # type: ignore[arg-type]
                 ds_land = transform(
                     *land, key=cdc.ERA5_DATASETS.reanalysis_era5_land
-                ).compute()
+                ).persist()
             ds_land = ds_land.assign(date=pd.to_datetime(ds_land.date))
 
             print("interpolating")
             ds_land = utils.interpolate_to_target_latlon(ds_land, method="linear")
 
             print("combining")
-            combined = ds_land.combine_first(ds_single_level)
+            combined = ds_land.combine_first(ds_single_level).compute()
             datasets.append(combined)
 
-    ds_year = xr.concat(datasets, dim="date").sortby("date")
+    # Months are processed in order, so the concatenated dates are already sorted.
+    ds_year = xr.concat(datasets, dim="date")
     if "number" in ds_year:
         ds_year = ds_year.drop_vars("number")
 
@@ -262,12 +267,16 @@ def generate_historical_daily(
 
     years_and_variables = []
     complete = []
-    for v, y in itertools.product(target_variable, year):
-        path = cdata.daily_results_path("historical", v, y)
-        if not path.exists() or overwrite:
-            years_and_variables.append((y, v))
-        else:
-            complete.append((y, v))
+    for v in target_variable:
+        existing = utils.existing_file_names(
+            cdata.daily_results_path("historical", v, "*").parent
+        )
+        for y in year:
+            path = cdata.daily_results_path("historical", v, y)
+            if path.name not in existing or overwrite:
+                years_and_variables.append((y, v))
+            else:
+                complete.append((y, v))
 
     print(
         f"{len(complete)} tasks already done. "
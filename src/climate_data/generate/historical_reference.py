@@ -33,12 +33,6 @@ def generate_historical_reference_main(
         ds = ds.groupby("date.month").mean("date")
         reference_data.append(ds)
 
-    old_encoding = {
-        k: v
-        for k, v in xr.open_dataset(paths[0])["value"].encoding.items()
-        if k in ["dtype", "_FillValue", "scale_factor", "add_offset"]
-    }
-
     print("Averaging years by month")
     reference = sum(reference_data) / len(reference_data)
     print("Saving reference data")
@@ -47,7 +41,7 @@ def generate_historical_reference_main(
         scenario="historical",
         variable=target_variable,
         year="reference",
-        encoding_kwargs=old_encoding,
+        encoding_kwargs=TRANSFORM_MAP[target_variable].encoding_kwargs,
     )
 
 
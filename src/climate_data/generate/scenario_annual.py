@@ -2,7 +2,8 @@ import itertools
 from pathlib import Path
 
 import click
-import xarray as xr
+import dask
+import numpy as np
 from dask.diagnostics.progress import ProgressBar
 from rra_tools import jobmon
 
@@ -23,6 +24,14 @@ from climate_data.generate.scenario_daily import (
 
 TEMP_THRESHOLDS = [30]
 
+# Annual collapses reduce each pixel over the full year, so read the daily data in
+# spatial tiles that each hold the whole date axis.
+DAILY_CHUNKS = {"date": -1, "latitude": 256, "longitude": 256}
+# Daily sources smaller than this are loaded into memory whole. The collapses then
+# run directly on NumPy arrays instead of through a dask graph, which is faster on
+# the single core the annual tasks run with.
+DAILY_LOAD_BYTES = 32 * 1024**3
+
 
 TRANSFORM_MAP = {
     "mean_temperature": utils.Transform(
@@ -43,17 +52,14 @@ TRANSFORM_MAP = {
     **{
         f"days_over_{temp}C": utils.Transform(
             source_variables=["mean_temperature"],
-            transform_funcs=[utils.count_threshold(temp), utils.annual_sum],
+            transform_funcs=[utils.annual_count_threshold(temp)],
         )
         for temp in TEMP_THRESHOLDS
     },
     **{
         f"{disease}_suitability": utils.Transform(
             source_variables=["mean_temperature"],
-            transform_funcs=[
-                utils.map_suitability(disease),
-                utils.annual_sum,
-            ],
+            transform_funcs=[utils.annual_suitability(disease)],
         )
         for disease in ["malaria", "dengue"]
     },
@@ -74,10 +80,16 @@ TRANSFORM_MAP = {
     ),
     "precipitation_days": utils.Transform(
         source_variables=["total_precipitation"],
-        transform_funcs=[utils.count_threshold(0.1), utils.annual_sum],
+        transform_funcs=[utils.annual_count_threshold(0.1)],
     ),
 }
 
+# Targets that share a source variable are generated together so the daily source
+# data is only built once per scenario, year, and GCM member.
+SOURCE_VARIABLES = sorted(
+    {transform.source_variables[0] for transform in TRANSFORM_MAP.values()}
+)
+
 # Notes about what to do:
 # We want to leave the interface for this function/entry point essentially the same.  We'll add in
 # a `draw` argument to the task function, but otherwise we'll keep the same interface.
@@ -85,8 +97,14 @@ TRANSFORM_MAP = {
 # compute the daily source variables in memory, then collapse them to the annual target variable.
 
 
+def get_gcm_members(cdata: ClimateData, source_variable: str) -> list[str]:
+    """Get the GCM members with CMIP6 inputs for a daily source variable."""
+    daily_source_variables = DAILY_TRANSFORM_MAP[source_variable][0].source_variables
+    return cdata.get_gcms(list(daily_source_variables))
+
+
 def generate_scenario_annual_main(
-    target_variable: str,
+    target_variables: list[str],
     scenario: str,
     year: str,
     gcm_member: str,
@@ -94,61 +112,95 @@ def generate_scenario_annual_main(
     progress_bar: bool = False,
 ) -> None:
     cdata = ClimateData(output_dir)
-    transform = TRANSFORM_MAP[target_variable]
-
-    print("Loading files")
-    if scenario == "historical":
-        ds = transform(
-            *[
-                xr.open_dataset(
-                    cdata.daily_results_path(scenario, source_variable, year)
-                )
-                for source_variable in transform.source_variables
-            ]
-        )
-    else:
-        ds = transform(
-            *[
-                generate_scenario_daily_main(
-                    output_dir=output_dir,
-                    year=year,
-                    gcm_member=gcm_member,
-                    target_variable=source_variable,
-                    cmip6_experiment=scenario,
-                    write_output=False,
-                )
-                for source_variable in transform.source_variables
-            ]
+
+    # Group targets by source so each daily source is only read (or generated) once.
+    source_groups: dict[str, list[str]] = {}
+    for target_variable in target_variables:
+        source_variable = TRANSFORM_MAP[target_variable].source_variables[0]
+        source_groups.setdefault(source_variable, []).append(target_variable)
+
+    for source_variable, group in source_groups.items():
+        print(f"Loading {source_variable}")
+        # Annual means commute with the scale and offset encoding of the daily
+        # results, so they can be taken over the raw int16 values and decoded once
+        # afterwards. The daily results are validated to have no missing values.
+        encoded = scenario == "historical" and all(
+            TRANSFORM_MAP[v].transform_funcs == [utils.annual_mean] for v in group
         )
-    if progress_bar:
-        with ProgressBar():  # type: ignore[no-untyped-call]
-            ds = ds.compute()
-    else:
-        ds = ds.compute()
-
-    print("Saving files")
-    cdata.save_raw_annual_results(
-        ds,
-        scenario=scenario,
-        variable=target_variable,
-        year=year,
-        gcm_member=gcm_member,
-        encoding_kwargs=transform.encoding_kwargs,
-    )
+        if encoded:
+            daily = cdata.load_daily_results(
+                scenario,
+                source_variable,
+                year,
+                chunks=DAILY_CHUNKS,
+                mask_and_scale=False,
+            )
+        elif scenario == "historical":
+            # The daily results are int16 quantized on disk at a step of 0.01 or
+            # coarser. Decoding to float32 adds a rounding error far below that
+            # step, and halves the data the annual reductions have to read compared
+            # with float64.
+            daily = cdata.load_daily_results(
+                scenario, source_variable, year, chunks=DAILY_CHUNKS
+            ).astype(np.float32)
+        else:
+            daily = generate_scenario_daily_main(
+                output_dir=output_dir,
+                year=year,
+                gcm_member=gcm_member,
+                target_variable=source_variable,
+                cmip6_experiment=scenario,
+                write_output=False,
+            )
+        if daily.nbytes < DAILY_LOAD_BYTES:
+            daily = daily.load()
+        elif len(group) > 1:
+            daily = daily.persist()
+
+        for target_variable in group:
+            print(f"Computing {target_variable}")
+            transform = TRANSFORM_MAP[target_variable]
+            ds = transform(daily)
+            if encoded:
+                attrs = daily["value"].attrs
+                ds = ds * attrs.get("scale_factor", 1.0) + attrs.get("add_offset", 0.0)
+            # Only the single annual layer is materialized here. Writing it whole
+            # keeps it to one compressed chunk on disk.
+            if progress_bar:
+                with ProgressBar():  # type: ignore[no-untyped-call]
+                    ds = ds.compute()
+            else:
+                ds = ds.compute()
+
+            print(f"Saving {target_variable}")
+            cdata.save_raw_annual_results(
+                ds,
+                scenario=scenario,
+                variable=target_variable,
+                year=year,
+                gcm_member=gcm_member,
+                encoding_kwargs=transform.encoding_kwargs,
+            )
+        # Release this source before the next one is read or generated.
+        del daily, ds
 
 
 @click.command()  # type: ignore[arg-type]
-@clio.with_target_variable(list(TRANSFORM_MAP))
+@clio.with_source_variable(SOURCE_VARIABLES)
+@clio.with_target_variable(TRANSFORM_MAP, allow_all=True)
 @clio.with_scenario()
 @clio.with_year(cdc.HISTORY_YEARS + cdc.FORECAST_YEARS)
 @clio.with_gcm_member()
 @clio.with_output_directory(cdc.MODEL_ROOT)
+@clio.with_overwrite()
 def generate_scenario_annual_task(
-    target_variable: str,
+    source_variable: str,
+    target_variable: list[str],
     scenario: str,
     year: str,
     gcm_member: str,
     output_dir: str,
+    overwrite: bool,
 ) -> None:
     history_flags = [
         year in cdc.HISTORY_YEARS,
@@ -159,9 +211,29 @@ def generate_scenario_annual_task(
         msg = f"Historical years must use the 'historical' experiment and era5 GCM member. {year} {scenario} {gcm_member}"
         raise ValueError(msg)
 
-    generate_scenario_annual_main(
-        target_variable, scenario, year, gcm_member, output_dir, progress_bar=False
-    )
+    cdata = ClimateData(output_dir)
+    # Targets built from the same source share its GCM members, so every target
+    # in this source group was scheduled for this member.
+    target_variables = [
+        v
+        for v in target_variable
+        if TRANSFORM_MAP[v].source_variables[0] == source_variable
+        and (
+            overwrite
+            or not cdata.raw_annual_results_path(scenario, v, year, gcm_member).exists()
+        )
+    ]
+    if not target_variables:
+        # Finished by another run since this task was launched.
+        print("No targets left to generate.")
+        return
+
+    # The task runs on a single core, so compute any dask graphs in the calling
+    # thread rather than handing every chunk through a thread pool.
+    with dask.config.set(scheduler="synchronous"):
+        generate_scenario_annual_main(
+            target_variables, scenario, year, gcm_member, output_dir, progress_bar=False
+        )
 
 
 def build_arg_list(
@@ -175,9 +247,12 @@ def build_arg_list(
     trc, cc = 0, 0
 
     print_template = "{v:<30} {e:<12} {tra:>10} {ca:>10}"
-    print(
+    # Collect the summary table and print it once at the end.
+    rows = [
         print_template.format(v="VARIABLE", e="EXPERIMENT", tra="TO_RUN", ca="COMPLETE")
-    )
+    ]
+    # Each inclusion lookup reads the inclusion table, so only do it once per source.
+    gcm_members_by_source: dict[str, list[str]] = {}
 
     for v, s in itertools.product(target_variables, scenarios):
         if s == "historical":
@@ -185,27 +260,29 @@ def build_arg_list(
             gcm_members = ["era5"]
         else:
             years = cdc.FORECAST_YEARS
-            annual_source_variables = TRANSFORM_MAP[v].source_variables
-            daily_source_variables = itertools.chain(
-                *[
-                    DAILY_TRANSFORM_MAP[source_variable][0].source_variables
-                    for source_variable in annual_source_variables
-                ]
-            )
-            gcm_members = cdata.get_gcms(list(daily_source_variables))
+            source_variable = TRANSFORM_MAP[v].source_variables[0]
+            if source_variable not in gcm_members_by_source:
+                gcm_members_by_source[source_variable] = get_gcm_members(
+                    cdata, source_variable
+                )
+            gcm_members = gcm_members_by_source[source_variable]
 
+        existing: dict[Path, set[str]] = {}
         for y, g in itertools.product(years, gcm_members):
             path = cdata.raw_annual_results_path(
                 scenario=s, variable=v, year=y, gcm_member=g
             )
-            if not path.exists():
+            if path.parent not in existing:
+                existing[path.parent] = utils.existing_file_names(path.parent)
+            if path.name not in existing[path.parent]:
                 to_run.append((v, s, y, g))
             else:
                 complete.append((v, s, y, g))
 
         tra, ca = len(to_run) - trc, len(complete) - cc
         trc, cc = len(to_run), len(complete)
-        print(print_template.format(v=v, e=s, tra=tra, ca=ca))
+        rows.append(print_template.format(v=v, e=s, tra=tra, ca=ca))
+    print("\n".join(rows))
 
     if overwrite:
         to_run += complete
@@ -238,16 +315,29 @@ def generate_scenario_annual(
 
     if not to_run:
         return
+
+    # Each task generates every requested target built from one daily source, so
+    # the source is only built once and independent sources run in parallel.
+    source_groups = sorted(
+        {(TRANSFORM_MAP[v].source_variables[0], s, y, g) for v, s, y, g in to_run}
+    )
+    task_args: dict[str, str | None] = {
+        "output-dir": output_dir,
+        "target-variable": (
+            target_variable[0] if len(target_variable) == 1 else clio.RUN_ALL
+        ),
+    }
+    if overwrite:
+        task_args["overwrite"] = None
+
     jobmon.run_parallel(
         runner="cdtask",
         task_name="generate scenario_annual",
         flat_node_args=(
-            ("target-variable", "scenario", "year", "gcm-member"),
-            to_run,
+            ("source-variable", "scenario", "year", "gcm-member"),
+            source_groups,
         ),
-        task_args={
-            "output-dir": output_dir,
-        },
+        task_args=task_args,
         task_resources={
             "queue": queue,
             "cores": 1,
@@ -88,15 +88,23 @@ def load_and_shift_longitude(
     member_path: str | Path,
     time_slice: slice,
 ) -> xr.Dataset:
-    ds = xr.open_dataset(member_path).sortby("time").sel(time=time_slice).compute()
+    ds = xr.open_dataset(member_path)
+    # CMIP6 files are almost always stored in time order, and sorting would turn
+    # the slice below into a gather on every read.
+    if not ds.indexes["time"].is_monotonic_increasing:
+        ds = ds.sortby("time")
+    ds = ds.sel(time=time_slice).compute()
     if ds.time.size == 0:
         msg = "No data in slice"
         raise KeyError(msg)
-    ds = (
-        ds.assign_coords(lon=(ds.lon + 180) % 360 - 180)
-        .sortby("lon")
-        .rename({"lat": "latitude", "lon": "longitude"})
-    )
+    # Longitudes run from 0 to 360, so moving them to -180 to 180 is a cyclic shift
+    # of the western half to the front rather than a full sort.
+    shift = int(np.searchsorted(ds.lon.to_numpy(), 180))
+    ds = ds.roll(lon=-shift, roll_coords=True)
+    ds = ds.assign_coords(lon=(ds.lon + 180) % 360 - 180)
+    if not ds.indexes["lon"].is_monotonic_increasing:
+        ds = ds.sortby("lon")
+    ds = ds.rename({"lat": "latitude", "lon": "longitude"})
     return ds
 
 
@@ -107,15 +115,53 @@ def load_and_shift_longitude_and_correct_time(
     time_slice = slice(f"{year}-01-01", f"{year}-12-31")
     time_range = pd.date_range(f"{year}-01-01", f"{year}-12-31")
     ds = load_and_shift_longitude(member_path, time_slice)
-    ds = (
-        ds.assign_coords(time=ds.time.dt.floor("D"))
-        .interp_calendar(time_range)
-        .interpolate_na(dim="time", method="nearest", fill_value="extrapolate")
-        .rename({"time": "date"})
-    )
+    ds = ds.assign_coords(time=ds.time.dt.floor("D"))
+    if same_days(ds.time, time_range):
+        # Standard calendars, and noleap calendars outside leap years, already
+        # hold exactly the target days, so the interpolation would be the identity.
+        ds = ds.assign_coords(time=time_range)
+    else:
+        ds = ds.interp_calendar(time_range)
+    ds = fill_missing_days(ds).rename({"time": "date"})
     return ds
 
 
+def same_days(time: xr.DataArray, time_range: pd.DatetimeIndex) -> bool:
+    """Check whether ``time`` holds exactly the days in ``time_range``, in order.
+
+    Works for both numpy and cftime dates, so a source calendar that matches the
+    target day for day can be relabeled rather than interpolated.
+    """
+    if time.size != time_range.size:
+        return False
+    return all(
+        np.array_equal(getattr(time.dt, field).to_numpy(), getattr(time_range, field))
+        for field in ("year", "month", "day")
+    )
+
+
+def fill_missing_days(ds: xr.Dataset) -> xr.Dataset:
+    """Equivalent to ``ds.interpolate_na("time", method="nearest", fill_value="extrapolate")``.
+
+    After a calendar conversion the only gaps are usually whole days past either
+    end of the source calendar, which are filled by repeating the nearest valid
+    day. Any other missing values fall back to ``interpolate_na``.
+    """
+    da = ds.to_dataarray().transpose("time", ...)
+    missing = da.isnull().to_numpy().reshape(da.sizes["time"], -1)  # noqa: PD003
+    n_missing = missing.sum(axis=1)
+    if not n_missing.any():
+        return ds
+
+    empty = n_missing == missing.shape[1]
+    valid = np.flatnonzero(~empty)
+    partial = (n_missing > 0) & ~empty
+    if valid.size == 0 or partial.any() or empty[valid[0] : valid[-1]].any():
+        return ds.interpolate_na(dim="time", method="nearest", fill_value="extrapolate")
+    nearest = np.clip(np.arange(empty.size), valid[0], valid[-1])
+    return ds.isel(time=nearest).assign_coords(time=ds.time)
+
+
 def load_variable(
     member_path: str | Path,
     year: str | int,
@@ -137,18 +183,59 @@ def load_variable(
 
     variable = str(next(iter(ds)))
     conversion = CONVERT_MAP[variable]
-    ds = conversion(utils.rename_val_column(ds))
+    # The outputs are stored as int16 at a scale of 0.01 or coarser, so single
+    # precision is plenty for the anomaly arithmetic and halves its memory
+    # traffic. The calendar interpolation upcasts to float64, so cast last. Sources
+    # that were never interpolated are already float32 and are not copied again.
+    ds = conversion(utils.rename_val_column(ds)).astype(np.float32, copy=False)
     return ds
 
 
+def monthly_mean(ds: xr.Dataset) -> xr.Dataset:
+    """Equivalent to ``ds.groupby("date.month").mean("date")``.
+
+    When the dates are sorted, each month's days form contiguous runs, so they are
+    summed as slices rather than gathered into a copy of every month first. Data
+    with missing values falls back to the groupby.
+    """
+    sorted_dates = ds.indexes["date"].is_monotonic_increasing
+    if not sorted_dates or ds["value"].isnull().any():  # noqa: PD003
+        return ds.groupby("date.month").mean("date")
+
+    da = ds["value"].transpose("date", ...)
+    values = da.to_numpy()
+    months = ds["date"].dt.month.to_numpy()
+    bounds = np.r_[0, np.flatnonzero(np.diff(months)) + 1, months.size]
+    total = np.zeros((12, *values.shape[1:]))
+    count = np.zeros(12)
+    for start, end in itertools.pairwise(bounds):
+        total[months[start] - 1] += values[start:end].sum(axis=0)
+        count[months[start] - 1] += end - start
+
+    present = count > 0
+    mean = total[present] / count[present].reshape(-1, *[1] * (values.ndim - 1))
+    template = da.isel(date=0, drop=True)
+    return xr.Dataset(
+        {
+            "value": (
+                ("month", *template.dims),
+                mean.astype(values.dtype, copy=False),
+            )
+        },
+        coords={**template.coords, "month": np.flatnonzero(present) + 1},
+    )
+
+
 def compute_anomaly(
     reference: xr.Dataset, target: xr.Dataset, anomaly_type: str
 ) -> xr.Dataset:
-    reference = reference.groupby("date.month").mean("date")
+    # Select each day's month from the climatology so the anomaly is a single
+    # elementwise operation rather than a grouped one.
+    reference = monthly_mean(reference).sel(month=target["date"].dt.month)
     if anomaly_type == "additive":
-        anomaly = target.groupby("date.month") - reference
+        anomaly = target - reference
     elif anomaly_type == "multiplicative":
-        anomaly = (target + 1).groupby("date.month") / (reference + 1)
+        anomaly = (target + 1) / (reference + 1)
     else:
         msg = f"Unknown anomaly type: {anomaly_type}"
         raise ValueError(msg)
@@ -156,6 +243,53 @@ def compute_anomaly(
     return anomaly
 
 
+def apply_anomaly(
+    reference: xr.Dataset, anomaly: xr.Dataset, anomaly_type: str
+) -> xr.Dataset:
+    """Apply a daily anomaly to the monthly historical reference.
+
+    Equivalent to ``reference + anomaly.groupby("date.month")`` for additive
+    anomalies and ``reference * anomaly.groupby("date.month")`` for multiplicative
+    ones. When the dates are sorted, each month's reference layer is applied to
+    its contiguous block of days in place, rather than first being gathered into
+    a full daily copy of the reference.
+    """
+    if anomaly_type not in ("additive", "multiplicative"):
+        msg = f"Unknown anomaly type: {anomaly_type}"
+        raise ValueError(msg)
+
+    ref = reference["value"]
+    spatial_dims = [d for d in ref.dims if d != "month"]
+    da = anomaly["value"]
+    months = da["date"].dt.month.to_numpy()
+    ref_positions = ref.indexes["month"].get_indexer(months)
+    fast_path = (
+        not reference.chunks
+        and not anomaly.chunks
+        and set(da.dims) == {"date", *spatial_dims}
+        and anomaly.indexes["date"].is_monotonic_increasing
+        and (ref_positions >= 0).all()
+        and all(ref.indexes[d].equals(da.indexes[d]) for d in spatial_dims)
+    )
+    if not fast_path:
+        if anomaly_type == "additive":
+            return reference + anomaly.groupby("date.month")
+        return reference * anomaly.groupby("date.month")
+
+    da = da.transpose("date", *spatial_dims)
+    ref_values = ref.transpose("month", *spatial_dims).to_numpy()
+    values = da.to_numpy().astype(np.result_type(ref_values, da.dtype))
+    op = np.add if anomaly_type == "additive" else np.multiply
+    bounds = np.r_[0, np.flatnonzero(np.diff(months)) + 1, months.size]
+    for start, end in itertools.pairwise(bounds):
+        block = values[start:end]
+        op(block, ref_values[ref_positions[start]], out=block)
+    return xr.Dataset(
+        {"value": (da.dims, values)},
+        coords={**da.coords, "month": ("date", ref["month"].to_numpy()[ref_positions])},
+    )
+
+
 def generate_scenario_daily_main(
     target_variable: str,
     cmip6_experiment: str,
@@ -173,10 +307,16 @@ def generate_scenario_daily_main(
     ]
 
     print("loading historical reference")
-    historical_reference = cdata.load_daily_results(
-        scenario="historical",
-        variable=target_variable,
-        year="reference",
+    # The reference is the 12 monthly means, so it is small enough to load whole,
+    # which keeps apply_anomaly on its in-place path.
+    historical_reference = (
+        cdata.load_daily_results(
+            scenario="historical",
+            variable=target_variable,
+            year="reference",
+        )
+        .load()
+        .astype(np.float32)
     )
     # compute anomaly, resample anomaly and compute scenario data
     # load reference (monthly) and target (daily for a given year)
@@ -192,10 +332,7 @@ def generate_scenario_daily_main(
     print(f"{gcm_member}: resampling anomaly")
     resampled_anomaly = utils.interpolate_to_target_latlon(v_anomaly, method="linear")
     print(f"{gcm_member}: computing scenario data")
-    if anomaly_type == "additive":
-        scenario_data = historical_reference + resampled_anomaly.groupby("date.month")
-    else:
-        scenario_data = historical_reference * resampled_anomaly.groupby("date.month")
+    scenario_data = apply_anomaly(historical_reference, resampled_anomaly, anomaly_type)
     if write_output is True:
         print(f"{gcm_member}: Writing output")
         cdata.save_raw_daily_results(
@@ -252,14 +389,22 @@ def generate_scenario_daily(
 ) -> None:
     cdata = ClimateData(output_dir)
 
+    # The inclusion metadata is read from disk, so look up each variable's models
+    # once rather than for every experiment and year.
+    gcms = {
+        v: cdata.get_gcms(TRANSFORM_MAP[v][0].source_variables) for v in target_variable
+    }
+
     veyg = []
     complete = []
-    for v, e, y in itertools.product(target_variable, cmip6_experiment, year):
-        source_variables = TRANSFORM_MAP[v][0].source_variables
-        gcms = cdata.get_gcms(source_variables)
-        for g in gcms:
+    for v, e in itertools.product(target_variable, cmip6_experiment):
+        # List each output directory once instead of checking every file.
+        existing = utils.existing_file_names(
+            cdata.raw_daily_results_path(e, v, "*", "*").parent
+        )
+        for y, g in itertools.product(year, gcms[v]):
             path = cdata.raw_daily_results_path(e, v, y, g)
-            if not path.exists() or overwrite:
+            if path.name not in existing or overwrite:
                 veyg.append((g, y, v, e))
             else:
                 complete.append((g, y, v, e))
@@ -268,7 +413,7 @@ def generate_scenario_daily(
         print("All tasks already done.")
         return
 
-    print(f"{len(complete)} tasks already done. " f"Launching {len(veyg)} tasks")
+    print(f"{len(complete)} tasks already done. Launching {len(veyg)} tasks")
     jobmon.run_parallel(
         runner="cdtask",
         task_name="generate scenario_daily",
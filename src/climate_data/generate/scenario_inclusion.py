@@ -21,15 +21,20 @@ warnings.filterwarnings("ignore")
 def extract_metadata(data_path: Path) -> tuple[Any, ...]:
     meta = data_path.stem.split("_")
     try:
-        ds = xr.open_dataset(data_path)
-        year_start = ds["time.year"].min().item()
-        year_end = ds["time.year"].max().item()
-        duplicates = []
-        for coord in ["lat", "lon", "time"]:
-            if coord in ds.coords:
-                duplicates.append(bool(pd.Index(ds[coord]).duplicated().any()))
-            else:
-                duplicates.append(False)
+        # Only the coordinates are needed, and they are indexed on open, so the
+        # checks below never touch the data variables.
+        with xr.open_dataset(data_path) as ds:
+            years = ds["time.year"].to_numpy()
+            year_start = years.min().item()
+            year_end = years.max().item()
+            duplicates = []
+            for coord in ["lat", "lon", "time"]:
+                if coord in ds.indexes:
+                    duplicates.append(not ds.indexes[coord].is_unique)
+                elif coord in ds.coords:
+                    duplicates.append(bool(pd.Index(ds[coord]).duplicated().any()))
+                else:
+                    duplicates.append(False)
         can_load = True
     except (ValueError, RuntimeError):
         year_start, year_end, can_load, duplicates = (
@@ -74,11 +79,12 @@ def generate_scenario_inclusion_main(
     meta_df["valid"] = (
         meta_df["all_years"] & meta_df["can_load"] & meta_df["no_duplicates"]
     )
+    # Count the valid scenarios for each model directly rather than widening to a
+    # model by scenario table first.
     inclusion_df = (
         meta_df["valid"]
-        .unstack()
-        .fillna(value=False)
-        .sum(axis=1)
+        .groupby(level=["variable", "source", "variant"])
+        .sum()
         .rename("valid_scenarios")
         .reset_index()
     )
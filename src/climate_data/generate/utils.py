@@ -1,3 +1,5 @@
+import functools
+import os
 import typing
 from collections.abc import Callable
 from pathlib import Path
@@ -94,12 +96,22 @@ def identity(ds: xr.Dataset) -> xr.Dataset:
 ######################
 
 
+def _annual_reduce(ds: xr.Dataset, how: str, **kwargs: typing.Any) -> xr.Dataset:
+    years = np.unique(ds["date"].dt.year)
+    if years.size == 1:
+        # Annual transforms are usually applied to a single year of daily data. Reduce
+        # over the date axis directly rather than slicing out the lone group first.
+        return getattr(ds, how)("date", **kwargs).expand_dims(year=years)  # type: ignore[no-any-return]
+    return getattr(ds.groupby("date.year"), how)(**kwargs)  # type: ignore[no-any-return]
+
+
 def daily_mean(ds: xr.Dataset) -> xr.Dataset:
     return ds.groupby("time.date").mean()
 
 
 def annual_mean(ds: xr.Dataset) -> xr.Dataset:
-    return ds.groupby("date.year").mean()
+    # Accumulate in double precision so single precision daily data stays exact.
+    return _annual_reduce(ds, "mean", dtype=np.float64)
 
 
 def daily_max(ds: xr.Dataset) -> xr.Dataset:
@@ -107,7 +119,7 @@ def daily_max(ds: xr.Dataset) -> xr.Dataset:
 
 
 def annual_max(ds: xr.Dataset) -> xr.Dataset:
-    return ds.groupby("date.year").max()
+    return _annual_reduce(ds, "max")
 
 
 def daily_min(ds: xr.Dataset) -> xr.Dataset:
@@ -115,7 +127,7 @@ def daily_min(ds: xr.Dataset) -> xr.Dataset:
 
 
 def annual_min(ds: xr.Dataset) -> xr.Dataset:
-    return ds.groupby("date.year").min()
+    return _annual_reduce(ds, "min")
 
 
 def daily_sum(ds: xr.Dataset) -> xr.Dataset:
@@ -123,7 +135,7 @@ def daily_sum(ds: xr.Dataset) -> xr.Dataset:
 
 
 def annual_sum(ds: xr.Dataset) -> xr.Dataset:
-    return ds.groupby("date.year").sum()
+    return _annual_reduce(ds, "sum", dtype=np.float64)
 
 
 def count_threshold(threshold: int | float) -> Callable[[xr.Dataset], xr.Dataset]:
@@ -137,11 +149,17 @@ def count_between_threshold(
     lower_threshold: int | float, upper_threshold: int | float
 ) -> Callable[[xr.Dataset], xr.Dataset]:
     def count(ds: xr.Dataset) -> xr.Dataset:
-        return (ds > lower_threshold) & (ds < upper_threshold)
+        # Combine the masks in place to avoid allocating a third boolean cube.
+        in_range = ds > lower_threshold
+        in_range &= ds < upper_threshold
+        return in_range
 
     return count
 
 
+# The curves are tiny and fixed, so read each one once per process rather than on
+# every call of the mapping.
+@functools.cache
 def _load_suitability_curve(
     disease: str,
 ) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
@@ -149,31 +167,159 @@ def _load_suitability_curve(
         Path(__file__).parent / "supplementary_data" / f"{disease}_suitability.parquet"
     )
     t, s = df["temperature"].to_numpy(), df["suitability"].to_numpy()
+    if not np.allclose(np.diff(t), t[1] - t[0]):
+        msg = f"The {disease} suitability curve must be on an evenly spaced grid."
+        raise ValueError(msg)
+    # The cached arrays are shared by every caller.
+    t.flags.writeable = False
+    s.flags.writeable = False
     return t, s
 
 
-def map_suitability(disease: str) -> Callable[[xr.Dataset], xr.Dataset]:
+def _interp_uniform(
+    x: npt.NDArray[typing.Any],
+    xp: npt.NDArray[np.float64],
+    fp: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Equivalent to ``np.interp(x, xp, fp)`` for evenly spaced ``xp``.
+
+    Finds the interval for each value arithmetically rather than with a binary
+    search.
+    """
+    position = np.clip((x - xp[0]) / (xp[1] - xp[0]), 0, xp.size - 1)
+    # Index missing values at zero, they still propagate as NaN through the weight.
+    idx = np.nan_to_num(position).astype(np.intp)
+    np.clip(idx, 0, xp.size - 2, out=idx)
+    weight = position - idx
+    return (1 - weight) * fp[idx] + weight * fp[idx + 1]  # type: ignore[no-any-return]
+
+
+def _check_disease(disease: str) -> None:
     diseases = ["dengue", "malaria"]
     if disease not in diseases:
         msg = f"Invalid disease: {disease}. Must be one of {', '.join(diseases)}"
         raise ValueError(msg)
 
+
+def map_suitability(disease: str) -> Callable[[xr.Dataset], xr.Dataset]:
+    _check_disease(disease)
+
     def smap(ds: xr.Dataset) -> xr.Dataset:
         t, s = _load_suitability_curve(disease)
-        ds["value"] = (("date", "latitude", "longitude"), np.interp(ds["value"], t, s))
+        ds["value"] = (
+            ("date", "latitude", "longitude"),
+            _interp_uniform(ds["value"].to_numpy(), t, s),
+        )
         return ds
 
     return smap
 
 
+def _sum_over_days(
+    daily: npt.NDArray[typing.Any],
+    daily_func: Callable[[npt.NDArray[typing.Any]], npt.NDArray[typing.Any]],
+    dtype: type[np.generic],
+) -> npt.NDArray[typing.Any]:
+    # apply_ufunc moves the date dimension to the last axis, but each daily
+    # slice is still a contiguous block of the original array.
+    total = np.zeros(daily.shape[:-1], dtype=dtype)
+    for day in range(daily.shape[-1]):
+        total += daily_func(daily[..., day])
+    return total
+
+
+def _count_over_days(
+    daily: npt.NDArray[typing.Any],
+    threshold: float,
+) -> npt.NDArray[np.int16]:
+    # A year has at most 366 days, so the count fits in int16. Reusing a single
+    # mask buffer avoids allocating a fresh map for every day.
+    total = np.zeros(daily.shape[:-1], dtype=np.int16)
+    above = np.empty(daily.shape[:-1], dtype=bool)
+    for day in range(daily.shape[-1]):
+        np.greater(daily[..., day], threshold, out=above)
+        total += above
+    return total
+
+
+def _annual_accumulate(
+    ds: xr.Dataset,
+    accumulate_func: Callable[..., npt.NDArray[typing.Any]],
+    output_dtype: type[np.generic],
+    **kwargs: typing.Any,
+) -> xr.Dataset:
+    """Sum a daily map into annual totals one day at a time.
+
+    ``accumulate_func`` takes an array with the date on its last axis and returns
+    the totals over it. This is equivalent to mapping each day and then taking
+    the ``annual_sum``, but never holds more than a single day of the mapped
+    values in memory.
+    """
+
+    def accumulate(year_ds: xr.Dataset) -> xr.Dataset:
+        return xr.apply_ufunc(  # type: ignore[no-any-return]
+            accumulate_func,
+            year_ds,
+            input_core_dims=[["date"]],
+            kwargs=kwargs,
+            dask="parallelized",
+            output_dtypes=[output_dtype],
+        )
+
+    return ds.groupby("date.year").map(accumulate)
+
+
+def annual_count_threshold(
+    threshold: int | float,
+) -> Callable[[xr.Dataset], xr.Dataset]:
+    """Count the days in each year above a threshold.
+
+    Fused equivalent of ``[count_threshold(threshold), annual_sum]``.
+    """
+
+    def count(ds: xr.Dataset) -> xr.Dataset:
+        return _annual_accumulate(ds, _count_over_days, np.int16, threshold=threshold)
+
+    return count
+
+
+def annual_suitability(disease: str) -> Callable[[xr.Dataset], xr.Dataset]:
+    """Sum daily disease suitability over each year.
+
+    Fused equivalent of ``[map_suitability(disease), annual_sum]``.
+    """
+    _check_disease(disease)
+
+    def suitability(ds: xr.Dataset) -> xr.Dataset:
+        t, s = _load_suitability_curve(disease)
+        return _annual_accumulate(
+            ds,
+            _sum_over_days,
+            np.float64,
+            # Match annual_sum, which skips missing values.
+            daily_func=lambda day: np.nan_to_num(
+                _interp_uniform(day, t, s), copy=False
+            ),
+            dtype=np.float64,
+        )
+
+    return suitability
+
+
 ########################
 # Data transformations #
 ########################
 
 
 def vector_magnitude(x: xr.Dataset, y: xr.Dataset) -> xr.Dataset:
-    """Calculate the magnitude of a vector."""
-    return np.sqrt(x**2 + y**2)  # type: ignore[return-value]
+    """Calculate the magnitude of a vector.
+
+    ``np.hypot`` reads both components and writes the magnitude in a single pass,
+    without a temporary for either square, and stays in the input precision.
+    """
+    return xr.apply_ufunc(  # type: ignore[no-any-return]
+        np.hypot, x, y, join="inner", dataset_join="inner", dask="parallelized"
+    )
 
 
 def buck_vapor_pressure(temperature_c: xr.Dataset) -> xr.Dataset:
@@ -192,14 +338,23 @@ def buck_vapor_pressure(temperature_c: xr.Dataset) -> xr.Dataset:
     xr.Dataset
         Vapor pressure in hPa
     """
-    over_water = 6.1121 * np.exp(
-        (18.678 - temperature_c / 234.5) * (temperature_c / (257.14 + temperature_c))
+    return xr.apply_ufunc(  # type: ignore[no-any-return]
+        _buck_vapor_pressure, temperature_c, dask="parallelized"
     )
-    over_ice = 6.1115 * np.exp(
-        (23.036 - temperature_c / 333.7) * (temperature_c / (279.82 + temperature_c))
-    )
-    vp = xr.where(temperature_c > 0, over_water, over_ice)  # type: ignore[no-untyped-call]
-    return vp  # type: ignore[no-any-return]
+
+
+def _buck_vapor_pressure(t: npt.NDArray[typing.Any]) -> npt.NDArray[typing.Any]:
+    # The water and ice forms differ only in their constants, so pick those per
+    # cell and evaluate the exponential once rather than for both forms.
+    warm = t > 0
+
+    def coefficient(over_water: float, over_ice: float) -> npt.NDArray[typing.Any]:
+        return np.where(warm, t.dtype.type(over_water), t.dtype.type(over_ice))
+
+    a = coefficient(18.678, 23.036)
+    b = coefficient(234.5, 333.7)
+    c = coefficient(257.14, 279.82)
+    return coefficient(6.1121, 6.1115) * np.exp((a - t / b) * (t / (c + t)))  # type: ignore[no-any-return]
 
 
 def rh_percent(
@@ -219,11 +374,25 @@ def rh_percent(
     xr.Dataset
         Relative humidity as a percentage
     """
-    # saturation vapour pressure
-    svp = buck_vapor_pressure(temperature_c)
-    # actual vapour pressure
-    vp = buck_vapor_pressure(dewpoint_temperature_c)
-    return 100 * vp / svp
+    return xr.apply_ufunc(  # type: ignore[no-any-return]
+        _rh_percent,
+        temperature_c,
+        dewpoint_temperature_c,
+        join="inner",
+        dataset_join="inner",
+        dask="parallelized",
+    )
+
+
+def _rh_percent(
+    t: npt.NDArray[typing.Any], td: npt.NDArray[typing.Any]
+) -> npt.NDArray[typing.Any]:
+    # Scale the actual vapour pressure by the saturation vapour pressure in the
+    # buffer it was computed in, rather than allocating a new array per step.
+    rh = _buck_vapor_pressure(td)
+    rh *= 100
+    rh /= _buck_vapor_pressure(t)
+    return rh
 
 
 ################
@@ -231,11 +400,141 @@ def rh_percent(
 ################
 
 
+def existing_file_names(directory: Path) -> set[str]:
+    """List the files in a directory with a single scandir call.
+
+    Launchers use this to check for existing outputs with set lookups rather
+    than a stat call per output path.
+
+    Parameters
+    ----------
+    directory
+        The directory to list.
+
+    Returns
+    -------
+    set[str]
+        The names of the entries in the directory, empty if it does not exist.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
 def rename_val_column(ds: xr.Dataset) -> xr.Dataset:
     data_var = next(iter(ds))
     return ds.rename({data_var: "value"})
 
 
+def _linear_weights(
+    source: npt.NDArray[typing.Any],
+    target: npt.NDArray[typing.Any],
+    extrapolate: bool = False,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+    """Bracketing indices and weights for linear interpolation along one axis.
+
+    The source coordinate may be in either order. Targets outside the source
+    range get a NaN weight so they come out missing, as with ``xr.Dataset.interp``.
+    With ``extrapolate``, they instead take the weights of the nearest target
+    inside the range, as a nearest-value fill of the interpolated axis would.
+    """
+    order = np.argsort(source)
+    xs = source[order].astype(np.float64)
+    if extrapolate:
+        inside = target[(target >= xs[0]) & (target <= xs[-1])]
+        if inside.size:
+            target = np.clip(target, inside.min(), inside.max())
+    # A target on a source point takes the interval below it, as xr.Dataset.interp
+    # does, so a missing value above that point does not leak into it.
+    lo = np.searchsorted(xs, target, side="left") - 1
+    np.clip(lo, 0, xs.size - 2, out=lo)
+    weight = (target - xs[lo]) / (xs[lo + 1] - xs[lo])
+    weight[(target < xs[0]) | (target > xs[-1])] = np.nan
+    return order[lo], order[lo + 1], weight
+
+
+def _interp_separable(
+    values: npt.NDArray[typing.Any],
+    lat_weights: tuple[
+        npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]
+    ],
+    lon_weights: tuple[
+        npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.float64]
+    ],
+    dtype: np.dtype[np.floating[typing.Any]],
+) -> npt.NDArray[np.floating[typing.Any]]:
+    """Bilinear interpolation over the last two axes with precomputed weights.
+
+    Latitude is interpolated first while the rows are still at the coarse
+    source longitude resolution, so only the final longitude step works on
+    arrays of the full target size.
+    """
+    lat_lo, lat_hi, lat_w = lat_weights
+    lon_lo, lon_hi, lon_w = lon_weights
+    values = values.astype(dtype, copy=False)
+    lower = values[..., lat_lo, :]
+    rows = values[..., lat_hi, :]
+    rows -= lower
+    rows *= lat_w.astype(dtype)[:, np.newaxis]
+    rows += lower
+
+    lower = np.take(rows, lon_lo, axis=-1)
+    out: npt.NDArray[typing.Any] = np.take(rows, lon_hi, axis=-1)
+    out -= lower
+    out *= lon_w.astype(dtype)
+    out += lower
+    return out
+
+
+def _interp_linear_latlon(
+    ds: xr.Dataset,
+    target_lon: xr.DataArray,
+    target_lat: xr.DataArray,
+    extrapolate: bool = False,
+) -> xr.Dataset:
+    """Linear regrid equivalent to ``ds.interp(..., method="linear")``.
+
+    The grids are separable, so the weights reduce to an index and weight table
+    per axis. These are computed once and shared by every variable and time step
+    instead of being rebuilt inside each interpolation call. Unlike ``ds.interp``,
+    single precision data is regridded in single precision.
+    """
+    dtype = np.result_type(np.float32, *[v.dtype for v in ds.data_vars.values()])
+    lat_weights = _linear_weights(
+        ds.latitude.to_numpy(), target_lat.to_numpy(), extrapolate
+    )
+    lon_weights = _linear_weights(
+        ds.longitude.to_numpy(), target_lon.to_numpy(), extrapolate
+    )
+    core_dims = ["latitude", "longitude"]
+    interpolated: xr.Dataset = xr.apply_ufunc(
+        _interp_separable,
+        ds.drop_vars(core_dims),
+        input_core_dims=[core_dims],
+        output_core_dims=[core_dims],
+        exclude_dims=set(core_dims),
+        kwargs={
+            "lat_weights": lat_weights,
+            "lon_weights": lon_weights,
+            "dtype": dtype,
+        },
+        dask="parallelized",
+        output_dtypes=[dtype],
+        dask_gufunc_kwargs={
+            "output_sizes": {
+                "latitude": target_lat.size,
+                "longitude": target_lon.size,
+            },
+            "allow_rechunk": True,
+        },
+    )
+    return interpolated.assign_coords(
+        latitude=target_lat.to_numpy(), longitude=target_lon.to_numpy()
+    ).transpose(*ds.dims)
+
+
 def interpolate_to_target_latlon(
     ds: xr.Dataset,
     method: str = "nearest",
@@ -260,15 +559,63 @@ def interpolate_to_target_latlon(
     xr.Dataset
         Interpolated dataset
     """
+    complete = method == "linear" and not ds.chunks
+    if complete:
+        has_nan = any(ds[v].isnull().any() for v in ds.data_vars)  # noqa: PD003
+        complete = not has_nan
+    if complete:
+        # Without missing source values, the nearest-value fill below only copies
+        # the edges of the regridded area outward along each axis. Taking the
+        # weights of the nearest in-range target gives the same values directly,
+        # without four more passes over the target grid.
+        interpolated = _interp_linear_latlon(
+            ds, target_lon, target_lat, extrapolate=True
+        )
+        if interpolated.indexes["latitude"].is_monotonic_increasing:
+            return interpolated.isel(latitude=slice(None, None, -1))
+        return interpolated.sortby("latitude", ascending=False)
+
+    if method == "linear":
+        interpolated = _interp_linear_latlon(ds, target_lon, target_lat)
+    else:
+        interpolated = ds.interp(
+            longitude=target_lon,
+            latitude=target_lat,
+            method=method,  # type: ignore[arg-type]
+        )
     return (
-        ds.interp(longitude=target_lon, latitude=target_lat, method=method)  # type: ignore[arg-type]
-        .interpolate_na(dim="longitude", method="nearest", fill_value="extrapolate")
+        interpolated.interpolate_na(
+            dim="longitude", method="nearest", fill_value="extrapolate"
+        )
         .sortby("latitude")
         .interpolate_na(dim="latitude", method="nearest", fill_value="extrapolate")
         .sortby("latitude", ascending=False)
     )
 
 
+def _compose(
+    transform_funcs: list[typing.Callable[..., xr.Dataset]],
+) -> typing.Callable[..., xr.Dataset]:
+    """Chain transform functions into a single callable.
+
+    The first function is applied to the input data, which can be multiple
+    datasets. Identity steps are dropped and a single remaining function is
+    returned as is, so most transforms call straight through.
+    """
+    funcs = [f for f in transform_funcs if f is not identity] or [identity]
+    if len(funcs) == 1:
+        return funcs[0]
+    first, *rest = funcs
+
+    def composed(*datasets: xr.Dataset) -> xr.Dataset:
+        res = first(*datasets)
+        for transform_func in rest:
+            res = transform_func(res)
+        return res
+
+    return composed
+
+
 class Transform:
     def __init__(
         self,
@@ -282,6 +629,15 @@ class Transform:
         self.transform_funcs = transform_funcs
         self.encoding_scale = encoding_scale
         self.encoding_offset = encoding_offset
+        # Resolve the function chains once here rather than on every call.
+        self._composed: (
+            typing.Callable[..., xr.Dataset]
+            | dict[str, typing.Callable[..., xr.Dataset]]
+        )
+        if isinstance(transform_funcs, dict):
+            self._composed = {k: _compose(v) for k, v in transform_funcs.items()}
+        else:
+            self._composed = _compose(transform_funcs)
 
     def __call__(self, *datasets: xr.Dataset, key: str | None = None) -> xr.Dataset:
         if len(datasets) > 1:
@@ -298,18 +654,12 @@ class Transform:
                 )
             datasets = tuple(datasets_list)
 
-        if isinstance(self.transform_funcs, dict):
+        if isinstance(self._composed, dict):
             if key is None:
                 msg = "Key must be provided for dict transform"
                 raise ValueError(msg)
-            transform_funcs = self.transform_funcs[key]
-        else:
-            transform_funcs = self.transform_funcs
-        # first function is applied to the input data which can have multiple xarray datasets
-        res = transform_funcs[0](*datasets)
-        for transform_func in transform_funcs[1:]:
-            res = transform_func(res)
-        return res
+            return self._composed[key](*datasets)
+        return self._composed(*datasets)
 
     @property
     def encoding_kwargs(self) -> dict[str, float]:
@@ -0,0 +1,35 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pytest
+import xarray as xr
+
+
+@pytest.fixture
+def make_daily() -> Callable[..., xr.Dataset]:
+    """Build random daily ``value`` datasets on a small global grid."""
+
+    def _make_daily(
+        *,
+        dates: pd.Index | None = None,
+        dim: str = "date",
+        offset: float = 0.0,
+        scale: float = 1.0,
+        seed: int = 0,
+        dtype: npt.DTypeLike = np.float32,
+    ) -> xr.Dataset:
+        if dates is None:
+            dates = pd.date_range("2021-01-01", "2021-12-31")
+        latitude = np.linspace(60.0, -60.0, 5)
+        longitude = np.linspace(-150.0, 150.0, 7)
+        values = offset + scale * np.random.default_rng(seed).random(
+            (dates.size, latitude.size, longitude.size)
+        )
+        return xr.Dataset(
+            {"value": ((dim, "latitude", "longitude"), values.astype(dtype))},
+            coords={dim: dates, "latitude": latitude, "longitude": longitude},
+        )
+
+    return _make_daily
@@ -0,0 +1,151 @@
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from climate_data.generate import utils
+
+
+@pytest.mark.parametrize("how", ["mean", "max", "min", "sum"])
+@pytest.mark.parametrize("case", ["float", "bool", "chunked", "two_years"])
+def test_annual_reductions_match_groupby(
+    make_daily: Callable[..., xr.Dataset], how: str, case: str
+) -> None:
+    if case == "two_years":
+        ds = make_daily(dates=pd.date_range("2020-01-01", "2021-12-31"))
+    else:
+        ds = make_daily()
+    if case == "bool":
+        ds = ds > 0.5  # noqa: PLR2004
+    elif case == "chunked":
+        ds = ds.chunk(latitude=2)
+    expected = getattr(ds.groupby("date.year"), how)()
+    actual = getattr(utils, f"annual_{how}")(ds)
+    xr.testing.assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_annual_count_threshold_matches_sum(
+    make_daily: Callable[..., xr.Dataset], chunked: bool
+) -> None:
+    ds = make_daily(offset=25.0, scale=10.0)
+    ds["value"][3, 0, 0] = np.nan
+    if chunked:
+        ds = ds.chunk(latitude=2)
+    expected = utils.annual_sum(utils.count_threshold(30)(ds))
+    actual = utils.annual_count_threshold(30)(ds)
+    xr.testing.assert_allclose(actual.astype(np.float64), expected)
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_annual_suitability_matches_sum(
+    make_daily: Callable[..., xr.Dataset], chunked: bool
+) -> None:
+    ds = make_daily(offset=16.0, scale=20.0, dtype=np.float64)
+    ds["value"][3, 0, 0] = np.nan
+    expected = utils.annual_sum(utils.map_suitability("malaria")(ds.copy(deep=True)))
+    if chunked:
+        ds = ds.chunk(latitude=2)
+    actual = utils.annual_suitability("malaria")(ds)
+    xr.testing.assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("disease", ["malaria", "dengue"])
+def test_map_suitability_matches_np_interp(
+    make_daily: Callable[..., xr.Dataset], disease: str
+) -> None:
+    # Cover the whole curve, values off either end of it, and a missing value.
+    ds = make_daily(offset=10.0, scale=30.0, dtype=np.float64)
+    ds["value"][3, 0, 0] = np.nan
+    curve = pd.read_parquet(
+        Path(utils.__file__).parent
+        / "supplementary_data"
+        / f"{disease}_suitability.parquet"
+    )
+    expected = ds.copy(deep=True)
+    expected["value"].values = np.interp(
+        ds["value"].to_numpy(), curve["temperature"], curve["suitability"]
+    )
+    actual = utils.map_suitability(disease)(ds)
+    xr.testing.assert_allclose(actual, expected)
+
+
+def regrid_baseline(
+    ds: xr.Dataset, target_lon: xr.DataArray, target_lat: xr.DataArray
+) -> xr.Dataset:
+    return (
+        ds.interp(longitude=target_lon, latitude=target_lat, method="linear")
+        .interpolate_na(dim="longitude", method="nearest", fill_value="extrapolate")
+        .sortby("latitude")
+        .interpolate_na(dim="latitude", method="nearest", fill_value="extrapolate")
+        .sortby("latitude", ascending=False)
+    )
+
+
+@pytest.mark.parametrize(
+    "case", ["complete", "ascending", "missing", "missing_aligned", "chunked"]
+)
+def test_interpolate_to_target_latlon_matches_interp(
+    make_daily: Callable[..., xr.Dataset], case: str
+) -> None:
+    ds = make_daily(dates=pd.date_range("2021-01-01", periods=10), dtype=np.float64)
+    if case == "ascending":
+        ds = ds.isel(latitude=slice(None, None, -1))
+    elif case.startswith("missing"):
+        ds["value"][:, 1, 2] = np.nan
+    elif case == "chunked":
+        ds = ds.chunk(date=5)
+    if case == "missing_aligned":
+        # Targets on the source points next to the missing one.
+        lon, lat = np.arange(-150.0, 151.0, 25.0), np.arange(60.0, -61.0, -15.0)
+    else:
+        lon, lat = np.arange(-179.5, 180.0, 15.0), np.arange(89.5, -90.0, -15.0)
+    target_lon = xr.DataArray(lon, dims="longitude")
+    target_lat = xr.DataArray(lat, dims="latitude")
+    expected = regrid_baseline(ds, target_lon, target_lat)
+    actual = utils.interpolate_to_target_latlon(
+        ds, method="linear", target_lon=target_lon, target_lat=target_lat
+    )
+    assert not actual["value"].isnull().any()  # noqa: PD003
+    xr.testing.assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("ascending", [False, True])
+@pytest.mark.parametrize("target", ["wider", "inside", "aligned"])
+def test_interpolate_to_target_latlon_fills_edges(
+    make_daily: Callable[..., xr.Dataset], ascending: bool, target: str
+) -> None:
+    ds = make_daily(dates=pd.date_range("2021-01-01", periods=10), dtype=np.float64)
+    if ascending:
+        ds = ds.isel(latitude=slice(None, None, -1))
+    lon, lat = {
+        "wider": (np.arange(-179.5, 180.0, 15.0), np.arange(89.5, -90.0, -15.0)),
+        "inside": (np.arange(-140.0, 141.0, 20.0), np.arange(50.0, -51.0, -10.0)),
+        # Targets that land exactly on source points, including the outermost.
+        "aligned": (np.arange(-150.0, 151.0, 25.0), np.arange(60.0, -61.0, -20.0)),
+    }[target]
+    target_lon = xr.DataArray(lon, dims="longitude")
+    target_lat = xr.DataArray(lat, dims="latitude")
+    expected = regrid_baseline(ds, target_lon, target_lat)
+    actual = utils.interpolate_to_target_latlon(
+        ds, method="linear", target_lon=target_lon, target_lat=target_lat
+    )
+    xr.testing.assert_allclose(actual, expected)
+
+
+def test_buck_vapor_pressure_matches_branches(
+    make_daily: Callable[..., xr.Dataset],
+) -> None:
+    t = make_daily(
+        dates=pd.date_range("2021-01-01", periods=10),
+        offset=-30.0,
+        scale=60.0,
+        dtype=np.float64,
+    )
+    over_water = 6.1121 * np.exp((18.678 - t / 234.5) * (t / (257.14 + t)))
+    over_ice = 6.1115 * np.exp((23.036 - t / 333.7) * (t / (279.82 + t)))
+    expected = xr.where(t > 0, over_water, over_ice)  # type: ignore[no-untyped-call]
+    xr.testing.assert_allclose(utils.buck_vapor_pressure(t), expected)
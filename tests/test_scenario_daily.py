@@ -0,0 +1,109 @@
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+
+from climate_data.generate import scenario_daily
+
+
+@pytest.mark.parametrize("case", ["sorted", "missing", "unsorted"])
+def test_monthly_mean_matches_groupby(
+    make_daily: Callable[..., xr.Dataset], case: str
+) -> None:
+    ds = make_daily(dates=pd.date_range("2019-01-01", "2021-12-31"))
+    if case == "missing":
+        ds["value"][40, 1, 1] = np.nan
+    elif case == "unsorted":
+        ds = ds.isel(date=np.random.default_rng(1).permutation(ds.sizes["date"]))
+    expected = ds.groupby("date.month").mean("date")
+    actual = scenario_daily.monthly_mean(ds)
+    xr.testing.assert_allclose(actual, expected.transpose(*actual.dims), rtol=1e-6)
+
+
+@pytest.mark.parametrize("case", ["complete", "edges", "interior", "partial"])
+def test_fill_missing_days_matches_interpolate_na(
+    make_daily: Callable[..., xr.Dataset], case: str
+) -> None:
+    ds = make_daily(dim="time")
+    if case == "edges":
+        ds["value"][:2] = np.nan
+        ds["value"][-3:] = np.nan
+    elif case == "interior":
+        ds["value"][100] = np.nan
+    elif case == "partial":
+        ds["value"][-1, 0, 0] = np.nan
+    expected = ds.interpolate_na(dim="time", method="nearest", fill_value="extrapolate")
+    actual = scenario_daily.fill_missing_days(ds)
+    xr.testing.assert_allclose(actual, expected)
+
+
+@pytest.mark.parametrize("anomaly_type", ["additive", "multiplicative"])
+@pytest.mark.parametrize("case", ["in_memory", "chunked", "unsorted"])
+def test_apply_anomaly_matches_groupby(
+    make_daily: Callable[..., xr.Dataset], anomaly_type: str, case: str
+) -> None:
+    reference = make_daily(dates=pd.date_range("2019-01-01", "2020-12-31"))
+    reference = reference.groupby("date.month").mean("date")
+    anomaly = make_daily(seed=1)
+    if case == "chunked":
+        reference = reference.chunk(latitude=2)
+    elif case == "unsorted":
+        anomaly = anomaly.isel(date=slice(None, None, -1))
+    if anomaly_type == "additive":
+        expected = reference + anomaly.groupby("date.month")
+    else:
+        expected = reference * anomaly.groupby("date.month")
+    actual = scenario_daily.apply_anomaly(reference, anomaly, anomaly_type)
+    expected = expected.transpose(*actual["value"].dims).compute()
+    xr.testing.assert_allclose(actual, expected, rtol=1e-6)
+
+
+def test_apply_anomaly_rejects_unknown_type(
+    make_daily: Callable[..., xr.Dataset],
+) -> None:
+    reference = make_daily().groupby("date.month").mean("date")
+    with pytest.raises(ValueError, match="Unknown anomaly type"):
+        scenario_daily.apply_anomaly(reference, make_daily(), "exponential")
+
+
+@pytest.mark.parametrize("anomaly_type", ["additive", "multiplicative"])
+def test_compute_anomaly_matches_groupby(
+    make_daily: Callable[..., xr.Dataset], anomaly_type: str
+) -> None:
+    reference = make_daily(dates=pd.date_range("2019-01-01", "2020-12-31"))
+    target = make_daily(seed=1)
+    monthly = reference.groupby("date.month").mean("date")
+    if anomaly_type == "additive":
+        expected = target.groupby("date.month") - monthly
+    else:
+        expected = (target + 1).groupby("date.month") / (monthly + 1)
+    expected = expected.drop_vars("month")
+    actual = scenario_daily.compute_anomaly(reference, target, anomaly_type)
+    xr.testing.assert_allclose(actual, expected, rtol=1e-6, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    ("year", "calendar", "same"),
+    [
+        ("2021", "standard", True),
+        ("2021", "noleap", True),
+        ("2024", "standard", True),
+        ("2024", "noleap", False),
+        ("2021", "360_day", False),
+    ],
+)
+def test_same_days_matches_interp_calendar(
+    make_daily: Callable[..., xr.Dataset], year: str, calendar: str, same: bool
+) -> None:
+    time_range = pd.date_range(f"{year}-01-01", f"{year}-12-31")
+    time = xr.date_range(
+        f"{year}-01-01", periods=time_range.size, calendar=calendar, use_cftime=True
+    )
+    ds = make_daily(dates=time, dim="time")
+    assert scenario_daily.same_days(ds.time, time_range) is same
+    if same:
+        expected = ds.interp_calendar(time_range).astype(np.float32)
+        actual = ds.assign_coords(time=time_range)
+        xr.testing.assert_allclose(actual, expected, atol=1e-6)